@@ -44,6 +44,9 @@ class SimulationResponse(BaseModel):
 class TeamCreateRequest(BaseModel):
     team_name: Optional[str] = None
 
+class TeamBulkCreateRequest(BaseModel):
+    teams: List[TeamCreateRequest]
+
 class DecisionSubmitRequest(BaseModel):
     team_id: str
     savings_rate: float = Field(..., ge=0.01, le=0.99)
@@ -63,6 +66,29 @@ class DecisionSubmitRequest(BaseModel):
             raise ValueError("Exchange rate policy must be 'undervalue', 'market', or 'overvalue'")
         return v
 
+class DecisionBatchRequest(BaseModel):
+    decisions: List[DecisionSubmitRequest]
+
+class SimulateRoundsRequest(BaseModel):
+    rounds: int = Field(..., ge=1)
+    decisions: List[DecisionSubmitRequest]  # Resubmitted before every round
+
+class DecisionResponse(BaseModel):
+    round: int
+    year: int
+    savings_rate: float
+    exchange_rate_policy: str
+    submitted_at: Optional[str] = None  # Not set on the initial default decision
+
+class TeamCreateResponse(BaseModel):
+    team_id: str
+    team_name: str
+    created_at: str
+    current_state: Dict[str, Any]
+    history: List[Dict[str, Any]]
+    decisions: List[DecisionResponse]
+    eliminated: bool
+
 class GameStateResponse(BaseModel):
     game_id: str
     current_round: int
@@ -80,9 +106,7 @@ def read_root():
 @app.post("/game/init", response_model=GameStateResponse)
 def initialize_game():
     """Initialize a new game."""
-    global game_state
-    game_state = GameState()  # Reset the game state
-    return game_state.get_game_state()
+    return game_state.reset_game()
 
 @app.post("/game/start", response_model=GameStateResponse)
 def start_game():
@@ -100,7 +124,7 @@ def advance_to_next_round():
         result = game_state.advance_round()
         # Log the result for debugging
         import logging
-        logging.debug(f"Advance round result: {result}")
+        logging.debug("Advance round result: %s", result)
         
         # If we got a successful result, return it
         return result
@@ -115,13 +139,34 @@ def advance_to_next_round():
         }
         raise HTTPException(status_code=500, detail=error_detail)
 
+@app.post("/game/simulate-rounds", response_model=GameStateResponse)
+def simulate_rounds(request: SimulateRoundsRequest):
+    """
+    Submit the same decisions and advance the game for several rounds,
+    stopping early if the game ends. Returns the resulting game state.
+    """
+    try:
+        return game_state.simulate_rounds(
+            request.rounds,
+            [decision.model_dump() for decision in request.decisions]
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        import traceback
+        error_detail = {
+            "error": str(e),
+            "traceback": traceback.format_exc()
+        }
+        raise HTTPException(status_code=500, detail=error_detail)
+
 @app.get("/game/state", response_model=GameStateResponse)
 def get_game_state():
     """Get the current game state."""
     return game_state.get_game_state()
 
 # Team management endpoints
-@app.post("/teams/create")
+@app.post("/teams/create", response_model=TeamCreateResponse)
 def create_team(request: TeamCreateRequest):
     """Create a new team."""
     try:
@@ -130,7 +175,18 @@ def create_team(request: TeamCreateRequest):
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@app.post("/teams/decisions")
+@app.post("/teams/create-bulk", response_model=List[TeamCreateResponse])
+def create_teams_bulk(request: TeamBulkCreateRequest):
+    """
+    Create several teams in a single request.
+    Exceeding the team limit rejects the request without creating any teams.
+    """
+    try:
+        return game_state.create_teams([team.team_name for team in request.teams])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/teams/decisions", response_model=DecisionResponse)
 def submit_decision(request: DecisionSubmitRequest):
     """Submit a team's decision for the current round."""
     try:
@@ -143,6 +199,17 @@ def submit_decision(request: DecisionSubmitRequest):
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@app.post("/teams/decisions/batch", response_model=List[DecisionResponse])
+def submit_decisions_batch(request: DecisionBatchRequest):
+    """
+    Submit decisions for several teams in a single request.
+    An invalid entry rejects the whole batch without recording any decisions.
+    """
+    try:
+        return game_state.submit_decisions([decision.model_dump() for decision in request.decisions])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @app.get("/teams/{team_id}")
 def get_team_state(team_id: str):
     """Get the state of a specific team."""
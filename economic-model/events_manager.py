@@ -7,6 +7,7 @@ class EventsManager:
     
     def __init__(self):
         self.events = self._initialize_events()
+        self.events_by_year = self._index_events_by_year(self.events)
         
     def _initialize_events(self) -> List[Dict[str, Any]]:
         """Initialize economic events that will occur during the game."""
@@ -51,11 +52,18 @@ class EventsManager:
             }
         ]
     
+    def _index_events_by_year(self, events: List[Dict[str, Any]]) -> Dict[int, List[Dict[str, Any]]]:
+        """Group events by year so each round only looks at its own events."""
+        events_by_year = {}
+        for event in events:
+            events_by_year.setdefault(event["year"], []).append(event)
+        return events_by_year
+    
     def get_current_events(self, current_year: int) -> List[Dict[str, Any]]:
         """Get events that should be triggered in the current year."""
         current_events = []
-        for event in self.events:
-            if event["year"] == current_year and not event["triggered"]:
+        for event in self.events_by_year.get(current_year, []):
+            if not event["triggered"]:
                 event["triggered"] = True
                 current_events.append(event)
         return current_events
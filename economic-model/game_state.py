@@ -1,9 +1,13 @@
 import numpy as np
+import os
 import uuid
 import logging
 import traceback
+import cProfile
+import pstats
+from functools import wraps
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from solow_model import calculate_next_round
 from team_management import TeamManager, DEFAULT_SAVINGS_RATE, DEFAULT_EXCHANGE_RATE_POLICY
 from events_manager import EventsManager
@@ -15,10 +19,33 @@ from solow_core import (
     calculate_fdi_ratio
 )
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Round results scaled by each event effect: TFP bonus (WTO) and GDP growth delta (GFC, COVID)
+EVENT_EFFECT_TARGETS = {
+    'tfp_increase': 'A_next',
+    'gdp_growth_delta': 'Y_t'
+}
+
+def _profile_if_env(func):
+    """
+    Profile the wrapped method with cProfile when GAME_PROFILE is set,
+    printing the top 20 calls by cumulative time.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not os.environ.get('GAME_PROFILE'):
+            return func(*args, **kwargs)
+        
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.disable()
+            pstats.Stats(profiler).sort_stats('cumulative').print_stats(20)
+    return wrapper
+
 class GameState:
     """
     Manages the in-memory state for a single game session with multiple teams.
@@ -43,10 +70,30 @@ class GameState:
         # Get default model parameters from the centralized utility function
         self.model_parameters = get_default_parameters()
     
+    def reset_game(self) -> Dict[str, Any]:
+        """Reset to a fresh game, clearing the component managers in place."""
+        self.game_id = str(uuid.uuid4())
+        self.created_at = datetime.now().isoformat()
+        self.current_round = 0
+        self.current_year = 1980
+        self.game_started = False
+        self.game_ended = False
+        
+        self.team_manager.reset()
+        self.events_manager.reset_events()
+        self.rankings_manager.reset()
+        
+        self.model_parameters = get_default_parameters()
+        return self.get_game_state()
+    
     def create_team(self, team_name: Optional[str] = None) -> Dict[str, Any]:
         """Create a new team with initial state."""
         return self.team_manager.create_team(team_name, self.current_year, self.current_round)
     
+    def create_teams(self, team_names: List[Optional[str]]) -> List[Dict[str, Any]]:
+        """Create several teams with initial state, all or nothing."""
+        return self.team_manager.create_teams(team_names, self.current_year, self.current_round)
+    
     def submit_decision(self, team_id: str, savings_rate: float, exchange_rate_policy: str) -> Dict[str, Any]:
         """Submit a team's decision for the current round."""
         return self.team_manager.submit_decision(
@@ -54,6 +101,10 @@ class GameState:
             self.current_round, self.current_year
         )
     
+    def submit_decisions(self, decisions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Submit decisions for several teams for the current round, all or nothing."""
+        return self.team_manager.submit_decisions(decisions, self.current_round, self.current_year)
+    
     def start_game(self) -> Dict[str, Any]:
         """Start the game with registered teams."""
         if len(self.team_manager.teams) == 0:
@@ -61,7 +112,7 @@ class GameState:
         
         self.game_started = True
         self.current_round = 0  # Start with round 0 (first round)
-        self.current_year = self.years[self.current_round]  # Set year to 1980
+        self.current_year = int(self.years[self.current_round])  # Set year to 1980
         
         # Archive initial state to history for all teams
         for team_id, team in self.team_manager.teams.items():
@@ -94,38 +145,41 @@ class GameState:
             'exchange_rate_policy': DEFAULT_EXCHANGE_RATE_POLICY
         }
     
-    def _apply_event_effects(self, round_results: Dict[str, Any], events: List[Dict[str, Any]], team_id: str) -> Dict[str, Any]:
+    def _compile_event_effects(self, events: List[Dict[str, Any]]) -> List[Tuple[str, float]]:
         """
-        Helper method to apply event effects to round results.
-        Returns the modified round_results and a list of applied event names.
+        Helper method to flatten the round's event effects into
+        (result_key, multiplier) pairs. Events are shared by all teams,
+        so this runs once per round rather than once per team.
         """
-        applied_event_names = []
+        compiled_effects = []
         
-        if not events:
-            return round_results, applied_event_names
-            
         for event in events:
             event_name = event.get('name', 'Unknown Event')
             event_year = event.get('year', None)
             effects = event.get('effects', {})
-            applied_event_names.append(event_name)
-            logger.info(f"Applying effects for event: {event_name} ({event_year}) to team {team_id}")
-
-            # Apply TFP bonus (WTO)
-            if 'tfp_increase' in effects:
-                tfp_bonus = effects['tfp_increase']
-                round_results['A_next'] *= (1 + tfp_bonus)
-                logger.debug(f"  Applied TFP bonus: {tfp_bonus}. New A_next: {round_results['A_next']}")
-
-            # Apply GDP growth delta (GFC, COVID)
-            if 'gdp_growth_delta' in effects:
-                gdp_delta = effects['gdp_growth_delta']
-                round_results['Y_t'] *= (1 + gdp_delta)
-                logger.debug(f"  Applied GDP delta: {gdp_delta}. New Y_t: {round_results['Y_t']}")
+            logger.info(f"Applying effects for event: {event_name} ({event_year})")
+            
+            for effect_key, result_key in EVENT_EFFECT_TARGETS.items():
+                if effect_key in effects:
+                    compiled_effects.append((result_key, 1 + effects[effect_key]))
+                    
+        return compiled_effects
+    
+    def _apply_event_effects(self, round_results: Dict[str, Any], compiled_effects: List[Tuple[str, float]], team_id: str) -> Dict[str, Any]:
+        """
+        Helper method to apply precompiled event effects to round results.
+        Returns the modified round_results.
+        """
+        for result_key, multiplier in compiled_effects:
+            round_results[result_key] *= multiplier
+            
+        if compiled_effects:
+            logger.debug("  Applied event effects to team %s. New A_next: %s, New Y_t: %s",
+                         team_id, round_results['A_next'], round_results['Y_t'])
                 
-        return round_results, applied_event_names
+        return round_results
     
-    def _process_team_round(self, team_id: str, team: Dict[str, Any], current_events: List[Dict[str, Any]]) -> None:
+    def _process_team_round(self, team_id: str, team: Dict[str, Any], event_effects: List[Tuple[str, float]]) -> None:
         """
         Process a single team's state for the current round.
         Extracts team processing logic from advance_round.
@@ -133,7 +187,7 @@ class GameState:
         if team["eliminated"]:
             return
             
-        logger.debug(f"Processing team {team_id}: {team['team_name']}")
+        logger.debug("Processing team %s: %s", team_id, team['team_name'])
         
         # Get the latest decision for this team
         # Decisions are submitted for the round *before* it is processed
@@ -143,19 +197,19 @@ class GameState:
             logger.warning(f"No decision found for team {team_id} for round {decision_round}. Using default.")
             latest_decision = self._get_default_decision()
 
-        logger.debug(f"Decision for round {decision_round}: {latest_decision}")
+        logger.debug("Decision for round %s: %s", decision_round, latest_decision)
 
         # Prepare parameters for this round
         current_round_index = self.current_round - 1
         params_for_round = self._get_parameters_for_round(current_round_index)
 
-        # Prepare current state for calculation
+        # Prepare current state for calculation (short keys, as set by TeamManager.create_team)
         current_state_for_calc = {
-            'Y': team['current_state']['GDP'],
-            'K': team['current_state']['Capital'],
-            'L': team['current_state']['Labor Force'],
-            'H': team['current_state']['Human Capital'],
-            'A': team['current_state']['Productivity (TFP)']
+            'Y': team['current_state']['Y'],
+            'K': team['current_state']['K'],
+            'L': team['current_state']['L'],
+            'H': team['current_state']['H'],
+            'A': team['current_state']['A']
         }
         
         # Prepare student inputs
@@ -164,7 +218,8 @@ class GameState:
             'e_policy': latest_decision['exchange_rate_policy']
         }
 
-        logger.debug(f"Calling calculate_next_round with state: {current_state_for_calc}, inputs: {student_inputs_for_calc}, year: {self.current_year}")
+        logger.debug("Calling calculate_next_round with state: %s, inputs: %s, year: %s",
+                     current_state_for_calc, student_inputs_for_calc, self.current_year)
 
         # Calculate next round
         round_results = calculate_next_round(
@@ -174,10 +229,10 @@ class GameState:
             year=self.current_year
         )
 
-        logger.debug(f"Results from calculate_next_round: {round_results}")
+        logger.debug("Results from calculate_next_round: %s", round_results)
 
         # Apply event effects
-        round_results, applied_event_names = self._apply_event_effects(round_results, current_events, team_id)
+        round_results = self._apply_event_effects(round_results, event_effects, team_id)
 
         # Prepare the full state dictionary for the next round
         next_state_data = {
@@ -192,14 +247,23 @@ class GameState:
             'Consumption': round_results['C_t'],
             'Investment': round_results['I_t'],
             'Savings Rate Decision': latest_decision['savings_rate'],
-            'Exchange Rate Decision': latest_decision['exchange_rate_policy']
+            'Exchange Rate Decision': latest_decision['exchange_rate_policy'],
+            # Short keys read by the next round, rankings and the frontend
+            'Y': round_results['Y_t'],
+            'K': round_results['K_next'],
+            'L': round_results['L_next'],
+            'H': round_results['H_next'],
+            'A': round_results['A_next'],
+            'NX': round_results['NX_t'],
+            'C': round_results['C_t']
         }
 
-        logger.debug(f"Updating team {team_id} with next state: {next_state_data}")
+        logger.debug("Updating team %s with next state: %s", team_id, next_state_data)
 
         # Update team state
         self.team_manager.update_team_state(team_id, next_state_data, self.current_year, self.current_round)
     
+    @_profile_if_env
     def advance_round(self) -> Dict[str, Any]:
         """Advance to the next round, simulating economic changes based on decisions."""
         if not self.game_started:
@@ -212,18 +276,19 @@ class GameState:
         try:
             # Move to next round (0-based index)
             self.current_round += 1
-            self.current_year = self.years[self.current_round]
+            self.current_year = int(self.years[self.current_round])
             
-            logger.debug(f"Advancing to round {self.current_round}, year {self.current_year}")
+            logger.debug("Advancing to round %s, year %s", self.current_round, self.current_year)
             
             # Get events for this round
             current_events = self.events_manager.get_current_events(self.current_year)
-            logger.debug(f"Current events: {current_events}")
+            logger.debug("Current events: %s", current_events)
+            event_effects = self._compile_event_effects(current_events)
             
             # Process each team's state based on their decisions
             for team_id, team in self.team_manager.teams.items():
                 try:
-                    self._process_team_round(team_id, team, current_events)
+                    self._process_team_round(team_id, team, event_effects)
                 except Exception as e:
                     logger.error(f"Error processing team {team_id}: {str(e)}")
                     logger.error(traceback.format_exc())
@@ -243,6 +308,25 @@ class GameState:
             logger.error(traceback.format_exc())
             raise
     
+    def simulate_rounds(self, rounds: int, decisions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Submit the same decisions and advance the game for several rounds,
+        stopping early if the game ends. Everything is checked before the
+        first round, so a rejected request leaves the game unchanged.
+        """
+        if not self.game_started:
+            raise ValueError("Cannot advance round: game not started")
+        
+        self.team_manager.validate_decisions(decisions)
+        
+        for _ in range(rounds):
+            self.submit_decisions(decisions)
+            self.advance_round()
+            if self.game_ended:
+                break
+        
+        return self.get_game_state()
+    
     def calculate_rankings(self) -> Dict[str, List[str]]:
         """Calculate team rankings based on different metrics."""
         return self.rankings_manager.calculate_rankings(self.team_manager.teams)
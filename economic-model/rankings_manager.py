@@ -1,8 +1,6 @@
 from typing import Dict, List, Any
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 class RankingsManager:
@@ -17,10 +15,15 @@ class RankingsManager:
             "balanced_economy": []
         }
     
+    def reset(self):
+        """Clear all rankings."""
+        for ranking in self.rankings.values():
+            ranking.clear()
+    
     def calculate_rankings(self, teams: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
         """Calculate team rankings based on different metrics."""
         try:
-            logger.debug(f"Calculating rankings for {len(teams)} teams")
+            logger.debug("Calculating rankings for %d teams", len(teams))
             
             # If no teams, return empty rankings
             if not teams:
@@ -31,7 +34,7 @@ class RankingsManager:
             valid_teams = []
             for team_id, team in teams.items():
                 if team.get("eliminated", False):
-                    logger.debug(f"Team {team_id} is eliminated, skipping")
+                    logger.debug("Team %s is eliminated, skipping", team_id)
                     continue
                     
                 current_state = team.get("current_state", {})
@@ -41,7 +44,7 @@ class RankingsManager:
                     
                 valid_teams.append(team_id)
                 
-            logger.debug(f"Valid teams for ranking: {valid_teams}")
+            logger.debug("Valid teams for ranking: %s", valid_teams)
             
             # If no valid teams, return empty rankings
             if not valid_teams:
@@ -54,7 +57,7 @@ class RankingsManager:
                 key=lambda team_id: teams[team_id]["current_state"].get("Y", 0),
                 reverse=True
             )
-            logger.debug(f"GDP ranking: {gdp_ranking}")
+            logger.debug("GDP ranking: %s", gdp_ranking)
             
             # Net Exports ranking
             net_exports_ranking = sorted(
@@ -62,7 +65,7 @@ class RankingsManager:
                 key=lambda team_id: teams[team_id]["current_state"].get("NX", 0),
                 reverse=True
             )
-            logger.debug(f"Net exports ranking: {net_exports_ranking}")
+            logger.debug("Net exports ranking: %s", net_exports_ranking)
             
             # Balanced Economy ranking (GDP + Consumption)
             balanced_economy_ranking = sorted(
@@ -73,7 +76,7 @@ class RankingsManager:
                 ),
                 reverse=True
             )
-            logger.debug(f"Balanced economy ranking: {balanced_economy_ranking}")
+            logger.debug("Balanced economy ranking: %s", balanced_economy_ranking)
             
             self.rankings = {
                 "gdp": gdp_ranking,
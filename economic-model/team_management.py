@@ -18,6 +18,9 @@ ECONOMIC_NOUNS = [
 DEFAULT_SAVINGS_RATE = 0.2  # 20%
 DEFAULT_EXCHANGE_RATE_POLICY = "market"
 
+# Maximum number of teams per game
+MAX_TEAMS = 10
+
 class TeamManager:
     """
     Manages team creation, decision submission, and team state.
@@ -25,6 +28,14 @@ class TeamManager:
     
     def __init__(self):
         self.teams = {}
+        # Per-team index of the latest decision submitted for each round,
+        # so lookups during round processing don't scan the decisions list
+        self.decisions_by_round = {}
+    
+    def reset(self):
+        """Remove all teams and their decisions."""
+        self.teams.clear()
+        self.decisions_by_round.clear()
     
     def generate_team_name(self) -> str:
         """Generate a fun, economics-themed team name."""
@@ -34,8 +45,8 @@ class TeamManager:
     
     def create_team(self, team_name: Optional[str] = None, current_year: int = 1980, current_round: int = 0) -> Dict[str, Any]:
         """Create a new team with initial state."""
-        if len(self.teams) >= 10:
-            raise ValueError("Maximum number of teams (10) already reached")
+        if len(self.teams) >= MAX_TEAMS:
+            raise ValueError(f"Maximum number of teams ({MAX_TEAMS}) already reached")
         
         team_id = str(uuid.uuid4())
         
@@ -57,6 +68,13 @@ class TeamManager:
             "initial_Y": 306.2  # Keep track of initial GDP for imports calculation
         }
         
+        initial_decision = {
+            "round": 0,
+            "year": 1980,
+            "savings_rate": DEFAULT_SAVINGS_RATE,
+            "exchange_rate_policy": DEFAULT_EXCHANGE_RATE_POLICY
+        }
+        
         # Initial team state
         team = {
             "team_id": team_id,
@@ -64,22 +82,26 @@ class TeamManager:
             "created_at": datetime.now().isoformat(),
             "current_state": initial_state,
             "history": [],
-            "decisions": [
-                {
-                    "round": 0,
-                    "year": 1980,
-                    "savings_rate": DEFAULT_SAVINGS_RATE,
-                    "exchange_rate_policy": DEFAULT_EXCHANGE_RATE_POLICY
-                }
-            ],
+            "decisions": [initial_decision],
             "eliminated": False
         }
         
         self.teams[team_id] = team
+        self.decisions_by_round[team_id] = {0: initial_decision}
         return team
     
-    def submit_decision(self, team_id: str, savings_rate: float, exchange_rate_policy: str, current_round: int, current_year: int) -> Dict[str, Any]:
-        """Submit a team's decision for the current round."""
+    def create_teams(self, team_names: List[Optional[str]], current_year: int = 1980, current_round: int = 0) -> List[Dict[str, Any]]:
+        """
+        Create several teams at once. The team limit is checked up front,
+        so a rejected request creates no teams.
+        """
+        if len(self.teams) + len(team_names) > MAX_TEAMS:
+            raise ValueError(f"Cannot create {len(team_names)} teams: maximum number of teams ({MAX_TEAMS}) would be exceeded")
+        
+        return [self.create_team(team_name, current_year, current_round) for team_name in team_names]
+    
+    def _validate_decision(self, team_id: str, savings_rate: float, exchange_rate_policy: str):
+        """Raise ValueError if the decision cannot be submitted for the team."""
         if team_id not in self.teams:
             raise ValueError(f"Team with ID {team_id} does not exist")
         
@@ -92,8 +114,9 @@ class TeamManager:
         
         if exchange_rate_policy not in ["undervalue", "market", "overvalue"]:
             raise ValueError("Exchange rate policy must be 'undervalue', 'market', or 'overvalue'")
-        
-        # Record the decision
+    
+    def _record_decision(self, team_id: str, savings_rate: float, exchange_rate_policy: str, current_round: int, current_year: int) -> Dict[str, Any]:
+        """Record an already validated decision."""
         decision = {
             "round": current_round,
             "year": current_year,
@@ -103,8 +126,33 @@ class TeamManager:
         }
         
         self.teams[team_id]["decisions"].append(decision)
+        self.decisions_by_round[team_id][current_round] = decision
         return decision
     
+    def submit_decision(self, team_id: str, savings_rate: float, exchange_rate_policy: str, current_round: int, current_year: int) -> Dict[str, Any]:
+        """Submit a team's decision for the current round."""
+        self._validate_decision(team_id, savings_rate, exchange_rate_policy)
+        return self._record_decision(team_id, savings_rate, exchange_rate_policy, current_round, current_year)
+    
+    def validate_decisions(self, decisions: List[Dict[str, Any]]):
+        """Raise ValueError if any of the decisions cannot be submitted."""
+        for decision in decisions:
+            self._validate_decision(decision["team_id"], decision["savings_rate"], decision["exchange_rate_policy"])
+    
+    def submit_decisions(self, decisions: List[Dict[str, Any]], current_round: int, current_year: int) -> List[Dict[str, Any]]:
+        """
+        Submit decisions for several teams for the current round.
+        Every decision is validated before any is recorded, so an invalid
+        entry leaves all teams' decisions unchanged.
+        """
+        self.validate_decisions(decisions)
+        return [
+            self._record_decision(
+                decision["team_id"], decision["savings_rate"], decision["exchange_rate_policy"],
+                current_round, current_year
+            ) for decision in decisions
+        ]
+    
     def get_team_state(self, team_id: str) -> Dict[str, Any]:
         """Get the state of a specific team."""
         if team_id not in self.teams:
@@ -141,13 +189,11 @@ class TeamManager:
         if team_id not in self.teams:
             raise ValueError(f"Team with ID {team_id} does not exist")
         
-        try:
-            latest_decision = next(d for d in reversed(self.teams[team_id]["decisions"]) 
-                                if d["round"] == round_num)
-            return latest_decision
-        except StopIteration:
+        latest_decision = self.decisions_by_round[team_id].get(round_num)
+        if latest_decision is None:
             # If no decision was made, use default values
             return {
                 "savings_rate": DEFAULT_SAVINGS_RATE,
                 "exchange_rate_policy": DEFAULT_EXCHANGE_RATE_POLICY
-            } 
\ No newline at end of file
+            }
+        return latest_decision 
\ No newline at end of file
@@ -0,0 +1,148 @@
+import unittest
+from fastapi.testclient import TestClient
+import app as app_module
+from app import app
+
+class TestAPI(unittest.TestCase):
+    """Test cases for the economic model HTTP endpoints."""
+
+    def setUp(self):
+        """Set up the test environment with a freshly initialized game."""
+        self.client = TestClient(app)
+        self.client.post("/game/init")
+
+    def _create_team(self, team_name=None):
+        """Helper to create a team and return its ID."""
+        response = self.client.post("/teams/create", json={"team_name": team_name})
+        self.assertEqual(response.status_code, 200)
+        return response.json()["team_id"]
+
+    def test_create_team_response_shape(self):
+        """Team creation returns exactly the fields of TeamCreateResponse."""
+        response = self.client.post("/teams/create", json={"team_name": "Team A"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.json()), {
+            "team_id", "team_name", "created_at", "current_state",
+            "history", "decisions", "eliminated"
+        })
+
+    def test_submit_decision_after_start(self):
+        """Decisions made after the game starts report an int year and a timestamp."""
+        team_id = self._create_team("Team A")
+        self.assertEqual(self.client.post("/game/start").status_code, 200)
+
+        response = self.client.post("/teams/decisions", json={
+            "team_id": team_id, "savings_rate": 0.3, "exchange_rate_policy": "market"
+        })
+        self.assertEqual(response.status_code, 200)
+        decision = response.json()
+        self.assertEqual(set(decision), {
+            "round", "year", "savings_rate", "exchange_rate_policy", "submitted_at"
+        })
+        self.assertIsInstance(decision["year"], int)
+        self.assertEqual(decision["year"], 1980)
+        self.assertIsInstance(decision["submitted_at"], str)
+
+    def test_create_teams_bulk(self):
+        """Bulk creation creates every requested team in order."""
+        response = self.client.post("/teams/create-bulk", json={"teams": [
+            {"team_name": "Team A"}, {"team_name": "Team B"}
+        ]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([t["team_name"] for t in response.json()], ["Team A", "Team B"])
+        self.assertEqual(len(app_module.game_state.team_manager.teams), 2)
+
+    def test_create_teams_bulk_over_capacity(self):
+        """Bulk creation beyond the team limit is rejected without creating any team."""
+        self._create_team("Team A")
+
+        response = self.client.post("/teams/create-bulk", json={"teams": [{}] * 10})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(app_module.game_state.team_manager.teams), 1)
+
+    def test_submit_decisions_batch(self):
+        """A batch records one decision per team and returns them in order."""
+        team_a = self._create_team("Team A")
+        team_b = self._create_team("Team B")
+
+        response = self.client.post("/teams/decisions/batch", json={"decisions": [
+            {"team_id": team_a, "savings_rate": 0.3, "exchange_rate_policy": "market"},
+            {"team_id": team_b, "savings_rate": 0.4, "exchange_rate_policy": "undervalue"}
+        ]})
+        self.assertEqual(response.status_code, 200)
+        decisions = response.json()
+        self.assertEqual([d["savings_rate"] for d in decisions], [0.3, 0.4])
+        self.assertEqual([d["exchange_rate_policy"] for d in decisions], ["market", "undervalue"])
+
+        team_manager = app_module.game_state.team_manager
+        self.assertEqual(team_manager.get_latest_decision(team_a, 0)["savings_rate"], 0.3)
+        self.assertEqual(team_manager.get_latest_decision(team_b, 0)["exchange_rate_policy"], "undervalue")
+
+    def test_submit_decisions_batch_unknown_team(self):
+        """A batch with an unknown team is rejected without recording anything."""
+        team_a = self._create_team("Team A")
+
+        response = self.client.post("/teams/decisions/batch", json={"decisions": [
+            {"team_id": team_a, "savings_rate": 0.5, "exchange_rate_policy": "overvalue"},
+            {"team_id": "missing", "savings_rate": 0.3, "exchange_rate_policy": "market"}
+        ]})
+        self.assertEqual(response.status_code, 400)
+
+        team_manager = app_module.game_state.team_manager
+        self.assertEqual(len(team_manager.teams[team_a]["decisions"]), 1)
+        self.assertEqual(team_manager.get_latest_decision(team_a, 0)["savings_rate"], 0.2)
+
+    def test_simulate_rounds(self):
+        """Simulating rounds advances the game and records each round's decisions."""
+        team_id = self._create_team("Team A")
+        self.assertEqual(self.client.post("/game/start").status_code, 200)
+
+        response = self.client.post("/game/simulate-rounds", json={"rounds": 2, "decisions": [
+            {"team_id": team_id, "savings_rate": 0.3, "exchange_rate_policy": "market"}
+        ]})
+        self.assertEqual(response.status_code, 200)
+        state = response.json()
+        self.assertEqual(state["current_round"], 2)
+        self.assertEqual(state["current_year"], 1990)
+        self.assertFalse(state["game_ended"])
+        self.assertEqual(state["teams"][team_id]["current_state"]["Savings Rate Decision"], 0.3)
+
+    def test_simulate_rounds_stops_at_game_end(self):
+        """Simulating past the final round stops once the game has ended."""
+        team_id = self._create_team("Team A")
+        self.client.post("/game/start")
+
+        response = self.client.post("/game/simulate-rounds", json={"rounds": 20, "decisions": [
+            {"team_id": team_id, "savings_rate": 0.3, "exchange_rate_policy": "market"}
+        ]})
+        self.assertEqual(response.status_code, 200)
+        state = response.json()
+        self.assertTrue(state["game_ended"])
+        self.assertEqual(state["current_year"], 2025)
+
+    def test_simulate_rounds_before_start(self):
+        """Simulating before the game starts is rejected without recording decisions."""
+        team_id = self._create_team("Team A")
+
+        response = self.client.post("/game/simulate-rounds", json={"rounds": 2, "decisions": [
+            {"team_id": team_id, "savings_rate": 0.3, "exchange_rate_policy": "market"}
+        ]})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(app_module.game_state.team_manager.teams[team_id]["decisions"]), 1)
+        self.assertEqual(app_module.game_state.current_round, 0)
+
+    def test_simulate_rounds_unknown_team(self):
+        """Simulating with an unknown team is rejected without recording or advancing."""
+        team_id = self._create_team("Team A")
+        self.client.post("/game/start")
+
+        response = self.client.post("/game/simulate-rounds", json={"rounds": 2, "decisions": [
+            {"team_id": team_id, "savings_rate": 0.3, "exchange_rate_policy": "market"},
+            {"team_id": "nope", "savings_rate": 0.3, "exchange_rate_policy": "market"}
+        ]})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(app_module.game_state.team_manager.teams[team_id]["decisions"]), 1)
+        self.assertEqual(app_module.game_state.current_round, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from game_state import GameState
+
+class TestGameState(unittest.TestCase):
+    """Test cases for GameState lifecycle management."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.game_state = GameState()
+
+    def test_reset_game(self):
+        """Resetting clears teams and progress while reusing the managers."""
+        team_manager = self.game_state.team_manager
+        self.game_state.create_team("Test Team")
+        self.game_state.start_game()
+        old_game_id = self.game_state.game_id
+
+        state = self.game_state.reset_game()
+
+        self.assertIs(self.game_state.team_manager, team_manager)
+        self.assertEqual(state['teams'], {})
+        self.assertEqual(state['current_round'], 0)
+        self.assertFalse(state['game_started'])
+        self.assertNotEqual(state['game_id'], old_game_id)
+        self.assertEqual(team_manager.decisions_by_round, {})
+        for ranking in state['rankings'].values():
+            self.assertEqual(ranking, [])
+
+    def test_event_effects_applied(self):
+        """Compiled event effects scale TFP and GDP once per matching effect."""
+        events = [
+            {"name": "China Joins WTO", "year": 2001, "effects": {"exports_multiplier": 1.25, "tfp_increase": 0.02}},
+            {"name": "Global Financial Crisis", "year": 2008, "effects": {"gdp_growth_delta": -0.03}}
+        ]
+        event_effects = self.game_state._compile_event_effects(events)
+        self.assertEqual(len(event_effects), 2)
+
+        round_results = self.game_state._apply_event_effects({'A_next': 1.0, 'Y_t': 100.0}, event_effects, "team")
+        self.assertAlmostEqual(round_results['A_next'], 1.02)
+        self.assertAlmostEqual(round_results['Y_t'], 97.0)
+
+    def test_advance_round(self):
+        """Advancing a round updates each team's state and the rankings."""
+        team_id = self.game_state.create_team("Test Team")["team_id"]
+        self.game_state.start_game()
+        self.game_state.submit_decision(team_id, 0.3, "market")
+
+        result = self.game_state.advance_round()
+
+        self.assertEqual(result['round'], 1)
+        self.assertIsInstance(result['year'], int)
+        current_state = self.game_state.get_team_state(team_id)['current_state']
+        self.assertEqual(current_state['round'], 1)
+        self.assertEqual(current_state['Savings Rate Decision'], 0.3)
+        self.assertEqual(current_state['Y'], current_state['GDP'])
+        self.assertGreater(current_state['K'], 0)
+        self.assertEqual(result['rankings']['gdp'], [team_id])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from team_management import TeamManager, DEFAULT_SAVINGS_RATE, DEFAULT_EXCHANGE_RATE_POLICY, MAX_TEAMS
+
+class TestTeamManager(unittest.TestCase):
+    """Test cases for TeamManager decision handling."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.team_manager = TeamManager()
+        self.team_id = self.team_manager.create_team("Test Team")["team_id"]
+
+    def test_initial_decision_lookup(self):
+        """The round 0 default decision is available without a submission."""
+        decision = self.team_manager.get_latest_decision(self.team_id, 0)
+        self.assertEqual(decision['savings_rate'], DEFAULT_SAVINGS_RATE)
+        self.assertEqual(decision['exchange_rate_policy'], DEFAULT_EXCHANGE_RATE_POLICY)
+
+    def test_latest_decision_wins(self):
+        """Resubmitting in the same round replaces the earlier decision."""
+        self.team_manager.submit_decision(self.team_id, 0.3, "market", 1, 1985)
+        self.team_manager.submit_decision(self.team_id, 0.4, "undervalue", 1, 1985)
+
+        decision = self.team_manager.get_latest_decision(self.team_id, 1)
+        self.assertEqual(decision['savings_rate'], 0.4)
+        self.assertEqual(decision['exchange_rate_policy'], "undervalue")
+        self.assertEqual(len(self.team_manager.teams[self.team_id]["decisions"]), 3)
+
+    def test_missing_round_uses_default(self):
+        """Rounds without a submission fall back to the default decision."""
+        self.team_manager.submit_decision(self.team_id, 0.3, "overvalue", 1, 1985)
+
+        decision = self.team_manager.get_latest_decision(self.team_id, 2)
+        self.assertEqual(decision['savings_rate'], DEFAULT_SAVINGS_RATE)
+        self.assertEqual(decision['exchange_rate_policy'], DEFAULT_EXCHANGE_RATE_POLICY)
+
+    def test_submit_decisions_all_or_nothing(self):
+        """An invalid entry rejects the whole batch without recording any decision."""
+        with self.assertRaises(ValueError):
+            self.team_manager.submit_decisions([
+                {"team_id": self.team_id, "savings_rate": 0.4, "exchange_rate_policy": "market"},
+                {"team_id": self.team_id, "savings_rate": 1.5, "exchange_rate_policy": "market"}
+            ], 1, 1985)
+
+        self.assertEqual(len(self.team_manager.teams[self.team_id]["decisions"]), 1)
+        self.assertEqual(self.team_manager.get_latest_decision(self.team_id, 1)['savings_rate'], DEFAULT_SAVINGS_RATE)
+
+    def test_create_teams_over_capacity(self):
+        """Creating more teams than the limit allows creates none of them."""
+        with self.assertRaises(ValueError):
+            self.team_manager.create_teams([None] * MAX_TEAMS)
+
+        self.assertEqual(len(self.team_manager.teams), 1)
+
+    def test_unknown_team(self):
+        """Looking up a decision for an unknown team raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.team_manager.get_latest_decision("missing", 0)
+
+if __name__ == '__main__':
+    unittest.main()